@@ -4,17 +4,20 @@ Implementation of the calculus-based encryption algorithm
 
 import math
 import numpy as np
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Union
+
+from key_functions import KeyFunction, resolve_key_function
 
 class CalculusEncryption:
-    def __init__(self, key_function: Callable[[float], float] = None):
+    def __init__(self, key_function: Union[str, KeyFunction, Callable[[float], float]] = None):
         """
         Initialize the calculus encryption system
         
         Args:
-            key_function: Mathematical function used as encryption key
+            key_function: Registered key name, KeyFunction or plain callable
+                used as encryption key (defaults to sin(2x) + cos(x))
         """
-        self.key_function = key_function or (lambda x: math.sin(2 * x) + math.cos(x))
+        self.key_function = resolve_key_function(key_function)
         self.constants = {
             'e': math.e,
             'pi': math.pi,
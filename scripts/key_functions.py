@@ -0,0 +1,176 @@
+"""
+Named key functions for the calculus encryption algorithm
+"""
+
+import hashlib
+import math
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from mathematical_formulas import MATHEMATICAL_CONSTANTS
+
+class KeyFunction:
+    def __init__(self, name: str, scalar: Callable[..., float],
+                 array: Optional[Callable[..., np.ndarray]] = None,
+                 derivative: Optional[Callable[..., float]] = None,
+                 params: Tuple[float, ...] = (), version: int = 1):
+        """
+        Describe a key function g(x) used by the encryption
+
+        Args:
+            name: Registry name of the key function
+            scalar: Implementation evaluated on a single float
+            array: NumPy implementation evaluated element-wise on an array
+            derivative: Optional analytic derivative g'(x)
+            params: Constants passed after x to every implementation
+            version: Bumped by hand whenever an implementation changes, so
+                the fingerprint changes with it
+
+        Implementations must be module-level functions so that instances
+        can be pickled and sent to worker processes.
+        """
+        self.name = name
+        self.scalar = scalar
+        self.array = array
+        self.derivative = derivative
+        self.params = tuple(params)
+        self.version = version
+        self._identity = None
+
+    def __call__(self, x: float) -> float:
+        return self.scalar(x, *self.params)
+
+    def __repr__(self) -> str:
+        return f"KeyFunction({self.name!r}, fingerprint={self.fingerprint!r})"
+
+    def evaluate(self, x) -> np.ndarray:
+        """
+        Evaluate the key function over an array of points
+        """
+        x = np.asarray(x, dtype=float)
+        if self.array is not None:
+            return self.array(x, *self.params)
+        # Compatibility path for keys without an array implementation
+        return np.vectorize(self.__call__, otypes=[float])(x)
+
+    def differentiate(self, x: float, h: float = 1e-7) -> float:
+        """
+        Evaluate g'(x), falling back to a central difference
+        """
+        if self.derivative is not None:
+            return self.derivative(x, *self.params)
+        return (self(x + h) - self(x - h)) / (2 * h)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Stable identifier for cache keys and ciphertext headers
+
+        Registered keys are identified by name, version and params only, so
+        the value does not depend on how the module was loaded or on the
+        Python version. Keys wrapping a plain callable are identified by the
+        object's id instead: the value is only unique within the running
+        process and such keys are marked as not cacheable.
+        """
+        identity = self._identity or f"{self.name}:v{self.version}:{self.params!r}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether the fingerprint is stable across processes
+        """
+        return self._identity is None
+
+    @classmethod
+    def from_callable(cls, func: Callable[[float], float]) -> "KeyFunction":
+        """
+        Wrap an arbitrary callable using the slower scalar-only path
+
+        The callable's content cannot be fingerprinted reliably, so the
+        resulting key is not cacheable and must not be persisted.
+        """
+        name = getattr(func, "__qualname__", type(func).__name__)
+        key = cls(f"custom:{name}", _call_wrapped, params=(func,))
+        key._identity = f"custom:{name}:{id(func)}"
+        return key
+
+def _call_wrapped(x, func):
+    return func(x)
+
+# Default key: g(x) = sin(2x) + cos(x)
+def _default_scalar(x):
+    return math.sin(2 * x) + math.cos(x)
+
+def _default_array(x):
+    return np.sin(2 * x) + np.cos(x)
+
+def _default_derivative(x):
+    return 2 * math.cos(2 * x) - math.sin(x)
+
+# Harmonic family: g(x) = sin(c x) + cos(x)
+def _harmonic_scalar(x, c):
+    return math.sin(c * x) + math.cos(x)
+
+def _harmonic_array(x, c):
+    return np.sin(c * x) + np.cos(x)
+
+def _harmonic_derivative(x, c):
+    return c * math.cos(c * x) - math.sin(x)
+
+# Gaussian family: g(x) = e^{-x^2/c} cos(c x)
+def _gaussian_scalar(x, c):
+    return math.exp(-x**2 / c) * math.cos(c * x)
+
+def _gaussian_array(x, c):
+    return np.exp(-x**2 / c) * np.cos(c * x)
+
+def _gaussian_derivative(x, c):
+    return -math.exp(-x**2 / c) * (2 * x / c * math.cos(c * x) + c * math.sin(c * x))
+
+KEY_FUNCTIONS: Dict[str, KeyFunction] = {}
+
+def register_key_function(key: KeyFunction) -> KeyFunction:
+    """Add a key function to the registry under its name"""
+    if key.name in KEY_FUNCTIONS:
+        raise ValueError(f"Key function already registered: {key.name}")
+    KEY_FUNCTIONS[key.name] = key
+    return key
+
+def get_key_function(name: str) -> KeyFunction:
+    """Look up a registered key function by name"""
+    try:
+        return KEY_FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown key function: {name}") from None
+
+def resolve_key_function(key: Union[str, KeyFunction, Callable[[float], float], None]) -> KeyFunction:
+    """Turn a name, KeyFunction, callable or None into a KeyFunction"""
+    if key is None:
+        return KEY_FUNCTIONS["default"]
+    if isinstance(key, KeyFunction):
+        return key
+    if isinstance(key, str):
+        return get_key_function(key)
+    if not callable(key):
+        raise TypeError(f"Key function must be a name, KeyFunction or callable, not {type(key).__name__}")
+    return KeyFunction.from_callable(key)
+
+register_key_function(KeyFunction("default", _default_scalar, _default_array, _default_derivative))
+
+for _constant_name, _constant in MATHEMATICAL_CONSTANTS.items():
+    register_key_function(KeyFunction(
+        f"harmonic_{_constant_name}", _harmonic_scalar, _harmonic_array, _harmonic_derivative, (_constant,)
+    ))
+    register_key_function(KeyFunction(
+        f"gaussian_{_constant_name}", _gaussian_scalar, _gaussian_array, _gaussian_derivative, (_constant,)
+    ))
+
+# Example usage and testing
+if __name__ == "__main__":
+    print("Registered Key Functions")
+    print("=" * 50)
+
+    grid = np.linspace(-1.0, 1.0, 5)
+    for name, key in KEY_FUNCTIONS.items():
+        print(f"{name} [{key.fingerprint}]: {np.round(key.evaluate(grid), 6).tolist()}")
@@ -2,6 +2,13 @@
 Mathematical formulas and LaTeX representations for the calculus encryption
 """
 
+import hashlib
+import math
+import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+
 # Core encryption formulas
 ENCRYPTION_FORMULAS = {
     "basic_encryption": r"E(x) = \int_0^x f'(t) \cdot g(t) \, dt + C",
@@ -32,15 +39,314 @@ MATHEMATICAL_CONSTANTS = {
     "sqrt_3": 1.7320508075688772
 }
 
+FORMULA_TABLES = {
+    "encryption": ENCRYPTION_FORMULAS,
+    "decryption": DECRYPTION_FORMULAS,
+    "complexity": COMPLEXITY_FORMULAS
+}
+
+# Memoized partial-sum stacks are evicted oldest first beyond this size
+_EVALUATOR_CACHE_BYTES = 64 * 2**20
+
+# Terms of sum 1/k! beyond this are below double precision of its leading term
+_MAX_FACTORIAL_TERMS = 32
+
+# erf has saturated to double precision beyond this upper limit
+_GAUSSIAN_INTEGRAL_LIMIT = 6.0
+
+class FormulaEvaluator:
+    def __init__(self, latex: str, approximations: Callable[..., Iterator[np.ndarray]],
+                 default_order: Optional[int], converges: bool = True):
+        """
+        Pair a LaTeX formula with a vectorized numeric evaluator
+
+        Args:
+            latex: LaTeX representation of the formula
+            approximations: Generator (grid, order, **params) yielding
+                exactly `order` successive approximations
+            default_order: Truncation order used when none is given, or
+                None for closed forms that yield a single exact value
+            converges: False when the approximations form a sequence without
+                a limit, which excludes the evaluator from error estimates
+        """
+        self.latex = latex
+        self._approximations = approximations
+        self.default_order = default_order
+        self.converges = converges
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+
+    def _resolve_order(self, order):
+        if self.default_order is None:
+            if order not in (None, 1):
+                raise ValueError("Closed-form formulas take no truncation order")
+            return 1
+        order = self.default_order if order is None else order
+        if int(order) != order or order < 1:
+            raise ValueError(f"order must be an integer >= 1, got {order}")
+        return int(order)
+
+    def _iterate(self, grid, order, params):
+        grid = np.asarray(grid, dtype=float)
+        return self._approximations(grid, self._resolve_order(order), **params)
+
+    def __call__(self, grid, order: Optional[int] = None, **params) -> np.ndarray:
+        value = None
+        for value in self._iterate(grid, order, params):
+            pass
+        return value
+
+    def partial_sums(self, grid, order: Optional[int] = None, **params) -> np.ndarray:
+        """
+        Successive approximations up to `order` stacked along axis 0
+
+        Stacks are memoized per grid and parameters unless a parameter is
+        unhashable, with the cache bounded by _EVALUATOR_CACHE_BYTES.
+        """
+        order = self._resolve_order(order)
+        key = _cache_key(grid, order, params)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        sums = np.stack(list(self._iterate(grid, order, params)))
+        sums.setflags(write=False)
+        if key is not None and sums.nbytes <= _EVALUATOR_CACHE_BYTES:
+            self._cache[key] = sums
+            self._cache_bytes += sums.nbytes
+            while self._cache_bytes > _EVALUATOR_CACHE_BYTES:
+                self._cache_bytes -= self._cache.popitem(last=False)[1].nbytes
+        return sums
+
+    def error_estimates(self, grid, order: Optional[int] = None, **params) -> np.ndarray:
+        """
+        Change between consecutive approximations for every truncation order
+
+        Order 1 has no previous approximation and is reported as NaN; closed
+        forms are exact and report zero.
+        """
+        self._check_converges()
+        sums = self.partial_sums(grid, order, **params)
+        if self.default_order is None:
+            return np.zeros_like(sums)
+        errors = np.empty_like(sums)
+        errors[0] = np.nan
+        errors[1:] = np.abs(np.diff(sums, axis=0))
+        return errors
+
+    def error_estimate(self, grid, order: Optional[int] = None, **params) -> np.ndarray:
+        """
+        Error estimate at the requested truncation order
+        """
+        self._check_converges()
+        previous = value = None
+        for approximation in self._iterate(grid, order, params):
+            previous, value = value, approximation
+        if self.default_order is None:
+            return np.zeros_like(value)
+        if previous is None:
+            return np.full_like(value, np.nan)
+        return np.abs(value - previous)
+
+    def _check_converges(self):
+        if not self.converges:
+            raise ValueError("Error estimates are undefined for a sequence without a limit")
+
+def _cache_key(grid, order, params):
+    """Hashable memoization key, or None when a parameter is unhashable"""
+    try:
+        key = (_array_key(grid), order) + tuple(
+            (name, _array_key(value) if isinstance(value, np.ndarray) else value)
+            for name, value in sorted(params.items())
+        )
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+    return key
+
+def _array_key(values):
+    values = np.ascontiguousarray(values, dtype=float)
+    return values.shape, hashlib.sha256(values.tobytes()).hexdigest()
+
+def _require_integers(n, minimum):
+    if np.any(n < minimum) or np.any(n != np.floor(n)):
+        raise ValueError(f"n must be integers >= {minimum}")
+
+def _basic_encryption(x, order, C=0.0, f_prime=None, g=None):
+    # Defaults follow the animation: f(t) = t^2, g(t) = sin(2t). Approximation
+    # k is composite Simpson's rule on [0, x] with 2^k panels; each doubling
+    # reuses all previous nodes and only evaluates the new midpoints
+    f_prime = f_prime or (lambda t: 2 * t)
+    g = g or (lambda t: np.sin(2 * t))
+    integrand = lambda t: f_prime(t) * g(t)
+    ends = integrand(np.zeros_like(x)) + integrand(x)
+    even = np.zeros_like(x)
+    odd = integrand(x / 2)
+    panels = 2
+    yield (ends + 4 * odd + 2 * even) * x / (3 * panels) + C
+    for _ in range(1, order):
+        even = even + odd
+        panels *= 2
+        odd = np.zeros_like(x)
+        for j in range(1, panels, 2):
+            odd = odd + integrand(x * (j / panels))
+        yield (ends + 4 * odd + 2 * even) * x / (3 * panels) + C
+
+def _advanced_encryption(x, order, a=1.0, omega=2.0):
+    # f(x) = e^{ax}, g(x) = sin(omega x); term n is Im(z_n) with
+    # z_n = z_{n-1} \cdot (-a i omega) / ((2n-1)(2n))
+    z = np.exp(a * x) * np.exp(1j * omega * x)
+    total = z.imag
+    yield total
+    for n in range(1, order):
+        z = z * (-a * 1j * omega) / ((2 * n - 1) * (2 * n))
+        total = total + z.imag
+        yield total
+
+def _key_generation(x, order):
+    envelope = np.exp(-x**2 / 2)
+    power = np.ones_like(x)
+    product = np.ones_like(x)
+    for k in range(1, order + 1):
+        power = power * x / k
+        product = product * (1 + power)
+        yield envelope * product
+
+def _security_measure(x, order, omega=2.0):
+    # E(x) = sin(omega x) and K(x) = e^{-x^2/2}, whose n-th derivative is
+    # (-1)^n He_n(x) e^{-x^2/2} with He_{n+1} = x He_n - n He_{n-1}. The
+    # terms grow like omega^n He_n(x), so this yields the n-th term of a
+    # sequence that has no limit rather than converging approximations.
+    envelope = np.exp(-x**2 / 2)
+    z = np.exp(1j * omega * x)
+    hermite_prev, hermite = np.ones_like(x), x.copy()
+    for n in range(1, order + 1):
+        z = z * (1j * omega)
+        yield np.abs(z.imag) * np.abs(hermite) * envelope
+        hermite_prev, hermite = hermite, x * hermite - n * hermite_prev
+
+def _basic_decryption(x, order, y=1.0, C=0.0, omega=2.0):
+    # Closed form of d/dx[(y - C) / g(x)] for g(x) = sin(omega x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yield -(y - C) * omega * np.cos(omega * x) / np.sin(omega * x)**2
+
+@lru_cache(maxsize=None)
+def _stehfest_weights(N):
+    half = N // 2
+    weights = []
+    for k in range(1, N + 1):
+        total = 0.0
+        for j in range((k + 1) // 2, min(k, half) + 1):
+            total += (j**half * math.factorial(2 * j)) / (
+                math.factorial(half - j) * math.factorial(j) * math.factorial(j - 1)
+                * math.factorial(k - j) * math.factorial(2 * j - k)
+            )
+        weights.append((-1) ** (k + half) * total)
+    return np.array(weights)
+
+def _default_transform(s):
+    # Laplace transform of y(t) = t e^{-t}
+    return 1 / (s + 1)**2
+
+def _default_key_transform(s):
+    # Laplace transform of g(t) = e^{-t}
+    return 1 / (s + 1)
+
+def _inverse_transform(t, order, Y=_default_transform, G=_default_key_transform, C=0.0):
+    # Gaver-Stehfest inversion, approximation k using N = 2k terms; accuracy
+    # is limited by cancellation in double precision beyond N of about 16.
+    # Defined for t > 0 only, other points evaluate to NaN.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        step = math.log(2) / np.where(t > 0, t, np.nan)
+        samples = []
+        for k in range(1, 2 * order + 1):
+            s = k * step
+            samples.append((Y(s) - C / s) / G(s))
+        samples = np.stack(samples)
+    for N in range(2, 2 * order + 1, 2):
+        yield step * np.tensordot(_stehfest_weights(N), samples[:N], axes=1)
+
+def _series_expansion(y, order, x=1.0, C=0.0, omega=2.0):
+    # Converges to log(1 + u) for -1 < u <= 1 with g(x) = sin(omega x); other
+    # points, including zeros of g, evaluate to NaN
+    g = np.sin(omega * np.asarray(x))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = (y - C) / g
+    u = np.where((g == 0) | ((np.abs(u) >= 1) & (u != 1)), np.nan, u)
+    power = np.ones_like(u)
+    total = np.zeros_like(u)
+    for n in range(1, order + 1):
+        power = power * u
+        total = total + (-1) ** (n + 1) * power / n
+        yield total
+
+def _time_complexity(n, order):
+    # Approximation j truncates the inner sum at k = min(n, j)
+    _require_integers(n, 1)
+    reciprocal = 1.0
+    partial = np.empty(order + 1)
+    partial[0] = 0.0
+    for k in range(1, order + 1):
+        reciprocal /= k
+        partial[k] = partial[k - 1] + reciprocal
+    scale = n * np.log(n)
+    for j in range(1, order + 1):
+        yield scale * partial[np.minimum(n, j).astype(int)]
+
+def _space_complexity(n, order):
+    # int_0^x e^{-t^2} dt = e^{-x^2} sum_k 2^k x^{2k+1} / (2k+1)!!, a series
+    # of positive terms built as term_k = term_{k-1} 2x^2 / (2k+1)
+    x = np.clip(n, -_GAUSSIAN_INTEGRAL_LIMIT, _GAUSSIAN_INTEGRAL_LIMIT)
+    term = x * np.exp(-x**2)
+    total = term
+    yield n**2 * total
+    for k in range(1, order):
+        term = term * 2 * x**2 / (2 * k + 1)
+        total = total + term
+        yield n**2 * total
+
+def _security_strength(n, order, log2=False):
+    # Taking f_i = i; the strength overflows to inf beyond n of about 60, so
+    # log2=True returns the exponent instead
+    _require_integers(n, 0)
+    count = int(np.max(n)) if n.size else 0
+    log2_factorial = np.cumsum(np.log2(np.arange(1, count + 1)))
+    bits = np.concatenate([[0.0], np.cumsum(np.floor(log2_factorial + 1e-9))])[n.astype(int)]
+    if log2:
+        yield bits
+    else:
+        with np.errstate(over="ignore"):
+            yield np.exp2(bits)
+
+FORMULA_EVALUATORS = {
+    "encryption": {
+        "basic_encryption": FormulaEvaluator(ENCRYPTION_FORMULAS["basic_encryption"], _basic_encryption, 6),
+        "advanced_encryption": FormulaEvaluator(ENCRYPTION_FORMULAS["advanced_encryption"], _advanced_encryption, 20),
+        "key_generation": FormulaEvaluator(ENCRYPTION_FORMULAS["key_generation"], _key_generation, 10),
+        "security_measure": FormulaEvaluator(ENCRYPTION_FORMULAS["security_measure"], _security_measure, 20, converges=False)
+    },
+    "decryption": {
+        "basic_decryption": FormulaEvaluator(DECRYPTION_FORMULAS["basic_decryption"], _basic_decryption, None),
+        "inverse_transform": FormulaEvaluator(DECRYPTION_FORMULAS["inverse_transform"], _inverse_transform, 7),
+        "series_expansion": FormulaEvaluator(DECRYPTION_FORMULAS["series_expansion"], _series_expansion, 50)
+    },
+    "complexity": {
+        "time_complexity": FormulaEvaluator(COMPLEXITY_FORMULAS["time_complexity"], _time_complexity, _MAX_FACTORIAL_TERMS),
+        "space_complexity": FormulaEvaluator(COMPLEXITY_FORMULAS["space_complexity"], _space_complexity, 120),
+        "security_strength": FormulaEvaluator(COMPLEXITY_FORMULAS["security_strength"], _security_strength, None)
+    }
+}
+
 def get_latex_formula(category, formula_name):
     """Get LaTeX representation of a formula"""
-    formulas = {
-        "encryption": ENCRYPTION_FORMULAS,
-        "decryption": DECRYPTION_FORMULAS,
-        "complexity": COMPLEXITY_FORMULAS
-    }
-    
-    return formulas.get(category, {}).get(formula_name, "Formula not found")
+    return FORMULA_TABLES.get(category, {}).get(formula_name, "Formula not found")
+
+def get_formula_evaluator(category, formula_name):
+    """Get the numeric evaluator paired with a formula"""
+    try:
+        return FORMULA_EVALUATORS[category][formula_name]
+    except KeyError:
+        raise ValueError(f"Formula not found: {category}/{formula_name}") from None
 
 def generate_key_sequence(n, base_constant="euler"):
     """Generate a mathematical key sequence"""
@@ -71,6 +377,17 @@ if __name__ == "__main__":
     for name, formula in COMPLEXITY_FORMULAS.items():
         print(f"{name}: {formula}")
     
+    print("\nNumeric Evaluation (x = 0.5, n = 5):")
+    for category, evaluators in FORMULA_EVALUATORS.items():
+        point = 5.0 if category == "complexity" else 0.5
+        for name, evaluator in evaluators.items():
+            value = evaluator(point)
+            if not evaluator.converges:
+                print(f"{name}: {float(value):.6f} (n-th term, diverges)")
+                continue
+            error = evaluator.error_estimate(point)
+            print(f"{name}: {float(value):.6f} (error ~ {float(error):.1e})")
+    
     print("\nSample Key Sequence:")
     key_seq = generate_key_sequence(10)
     print(key_seq)